@@ -2,6 +2,7 @@ import gzip
 import hashlib
 import json
 import os
+import re
 import shutil
 import sqlite3
 import subprocess
@@ -9,10 +10,13 @@ import tempfile
 import threading
 import time
 import uuid
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import httpx
 import yaml
 from fastapi import Depends, FastAPI, Header, HTTPException
 from fastapi.responses import JSONResponse, PlainTextResponse
@@ -21,7 +25,8 @@ from pydantic import BaseModel, Field
 
 APP = FastAPI(title="ops-agent", version="1.0.0")
 
-OPS_ROOT = Path("/home/munaim/srv/ops")
+# OPS_ROOT / OPS_BACKUP_ROOT let several agents share a host, e.g. local fleet peers
+OPS_ROOT = Path(os.environ.get("OPS_ROOT", "/home/munaim/srv/ops"))
 CONFIG_DIR = OPS_ROOT / "config"
 LOG_DIR = OPS_ROOT / "logs"
 RUN_LOG_DIR = LOG_DIR / "runs"
@@ -31,10 +36,12 @@ TOKEN_FILE = CONFIG_DIR / "ops_token.txt"
 RESTIC_PASSWORD_FILE = CONFIG_DIR / "restic_password.txt"
 AGE_KEY_FILE = CONFIG_DIR / "age.key"
 RCLONE_CONF = CONFIG_DIR / "rclone.conf"
+FLEET_FILE = Path(os.environ.get("OPS_FLEET_FILE", str(CONFIG_DIR / "fleet.yml")))
 
-BACKUP_REPO = Path("/srv/backups/restic_repo")
-BACKUP_WORK = Path("/srv/backups/work")
-BACKUP_META = Path("/srv/backups/meta")
+BACKUP_ROOT = Path(os.environ.get("OPS_BACKUP_ROOT", "/srv/backups"))
+BACKUP_REPO = BACKUP_ROOT / "restic_repo"
+BACKUP_WORK = BACKUP_ROOT / "work"
+BACKUP_META = BACKUP_ROOT / "meta"
 RUNS_META = BACKUP_META / "runs"
 DB_META = BACKUP_META / "backups.sqlite"
 
@@ -48,9 +55,58 @@ ALLOWLIST_ACTIONS = {
     "upload_snapshot",
     "rclone_test",
     "cloud_config",
+    "restore_drill",
 }
 
 RETENTION = {"daily": 14, "weekly": 8, "monthly": 12}
+RETENTION_BUCKETS = [("daily", "%Y-%m-%d"), ("weekly", "%G-W%V"), ("monthly", "%Y-%m"), ("yearly", "%Y")]
+RETENTION_KEYS = {"last"} | {unit for unit, _ in RETENTION_BUCKETS}
+PRUNE_MODES = ["forget", "repack", "routine"]
+PRUNE_MAX_UNUSED = "10%"
+PRUNE_MAX_REPACK_SIZE = "2G"
+PRUNE_PLAN_FILE = BACKUP_META / "prune_plan.json"
+PRUNE_PLAN_TTL_SECONDS = 3600
+
+VERIFY_SUBSETS = 20
+VERIFY_TIME_BUDGET_SECONDS = 1800
+VERIFY_BYTE_BUDGET = 10 * 1024**3
+RESTIC_LOCK_ERRORS = ["repository is already locked", "unable to create lock"]
+
+CHANGE_SKIP_MAX_AGE_DAYS = 7
+# WAL position catches every logged write; databases with unlogged tables (first field) are never skipped
+DB_FINGERPRINT_SQL = """
+SELECT concat_ws('|',
+  (SELECT count(*) FROM pg_class WHERE relpersistence = 'u'),
+  pg_current_wal_lsn(),
+  pg_postmaster_start_time(),
+  (SELECT stats_reset FROM pg_stat_database WHERE datname = current_database()),
+  (SELECT coalesce(sum(n_tup_ins + n_tup_upd + n_tup_del), 0) FROM pg_stat_all_tables),
+  (SELECT md5(coalesce(string_agg(schemaname || '.' || sequencename || '=' || coalesce(last_value, 0), ',' ORDER BY schemaname, sequencename), '')) FROM pg_sequences),
+  (SELECT md5(string_agg(t.x, ',' ORDER BY t.x)) FROM (
+    SELECT 'c' || oid || ':' || xmin AS x FROM pg_class
+    UNION ALL SELECT 'a' || attrelid || '.' || attnum || ':' || xmin FROM pg_attribute
+    UNION ALL SELECT 'd' || oid || ':' || xmin FROM pg_attrdef
+    UNION ALL SELECT 'p' || oid || ':' || xmin FROM pg_proc
+    UNION ALL SELECT 'k' || oid || ':' || xmin FROM pg_constraint
+    UNION ALL SELECT 't' || oid || ':' || xmin FROM pg_trigger
+    UNION ALL SELECT 'y' || oid || ':' || xmin FROM pg_type
+    UNION ALL SELECT 'n' || oid || ':' || xmin FROM pg_namespace
+  ) t)
+)
+"""
+
+RESTORE_DRILL_TARGETS = ["docker", "local"]
+RESTORE_DRILL_PARALLELISM = 2
+RESTORE_DRILL_PG_IMAGE = "postgres:16-alpine"
+RESTORE_DRILL_READY_TIMEOUT_SECONDS = 60
+RESTORE_RTO_OBJECTIVE_SECONDS = 1800
+RESTORE_DRILL_PHASES = ["fetch", "decompress", "provision", "load", "sanity"]
+# role names after OWNER TO / GRANT ... TO / REVOKE ... FROM in pg_dump output
+DUMP_ROLE_RE = re.compile(r"^(?:ALTER .* OWNER TO|GRANT .* TO|REVOKE .* FROM) (.+?)(?: WITH (?:GRANT|ADMIN) OPTION)?(?: GRANTED BY .+)?;$")
+DUMP_BUILTIN_ROLES = {"public", "current_user", "session_user", "current_role"}
+
+FLEET_TIMEOUT_SECONDS = 5.0
+FLEET_CACHE_TTL_SECONDS = 15.0
 
 for p in [LOG_DIR, RUN_LOG_DIR, BACKUP_REPO, BACKUP_WORK, BACKUP_META, RUNS_META]:
     p.mkdir(parents=True, exist_ok=True)
@@ -59,10 +115,26 @@ registry = CollectorRegistry()
 metric_backup_success = Gauge("ops_backup_last_success", "last backup success", ["app"], registry=registry)
 metric_backup_epoch = Gauge("ops_backup_last_epoch", "last backup timestamp", ["app"], registry=registry)
 metric_job_running = Gauge("ops_jobs_running", "jobs currently running", registry=registry)
+metric_verify_coverage_age = Gauge("ops_verify_coverage_age_seconds", "age of the oldest verified repository data subset", registry=registry)
+metric_verify_subsets_covered = Gauge("ops_verify_subsets_covered", "repository data subsets with a successful read check", registry=registry)
+metric_verify_subsets_total = Gauge("ops_verify_subsets_total", "repository data subsets in the verification rotation", registry=registry)
+metric_verify_last_success = Gauge("ops_verify_last_success", "last verification run success", registry=registry)
+metric_drill_rto = Gauge("ops_restore_drill_rto_seconds", "last restore drill wall time", ["app"], registry=registry)
+metric_drill_phase = Gauge("ops_restore_drill_phase_seconds", "last restore drill phase duration", ["app", "phase"], registry=registry)
+metric_drill_objective = Gauge("ops_restore_drill_rto_objective_seconds", "restore time objective", ["app"], registry=registry)
+metric_drill_success = Gauge("ops_restore_drill_last_success", "last restore drill success", ["app"], registry=registry)
+metric_drill_epoch = Gauge("ops_restore_drill_last_epoch", "last restore drill timestamp", ["app"], registry=registry)
 
 JOBS: Dict[str, Dict[str, Any]] = {}
 JOBS_LOCK = threading.Lock()
 
+FLEET_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="fleet")
+FLEET_CLIENTS: Dict[tuple, httpx.Client] = {}
+FLEET_CACHE: Dict[tuple, Dict[str, Any]] = {}
+FLEET_FAILURES: Dict[tuple, Dict[str, Any]] = {}
+FLEET_REFRESHING: set = set()
+FLEET_LOCK = threading.Lock()
+
 
 def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -97,9 +169,13 @@ def sha256_file(path: Path) -> str:
     return h.hexdigest()
 
 
-def load_apps() -> Dict[str, Dict[str, Any]]:
+def load_config_section(key: str) -> Dict[str, Any]:
     data = yaml.safe_load(APPS_FILE.read_text(encoding="utf-8")) or {}
-    return data.get("apps", {})
+    return data.get(key) or {}
+
+
+def load_apps() -> Dict[str, Dict[str, Any]]:
+    return load_config_section("apps")
 
 
 def ensure_restic_init() -> None:
@@ -113,6 +189,14 @@ def ensure_restic_init() -> None:
     ], env={"RESTIC_PASSWORD_FILE": str(RESTIC_PASSWORD_FILE)})
 
 
+def ensure_columns(cur: sqlite3.Cursor, table: str, columns: Dict[str, str]) -> None:
+    cur.execute(f"PRAGMA table_info({table})")
+    existing = {row[1] for row in cur.fetchall()}
+    for name, decl in columns.items():
+        if name not in existing:
+            cur.execute(f"ALTER TABLE {table} ADD COLUMN {name} {decl}")
+
+
 def init_db() -> None:
     con = sqlite3.connect(DB_META)
     cur = con.cursor()
@@ -128,10 +212,113 @@ def init_db() -> None:
         )
         """
     )
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS verify_subsets (
+            subset_total INTEGER NOT NULL,
+            subset_index INTEGER NOT NULL,
+            verified_at TEXT,
+            verified_job_id TEXT,
+            last_attempt_at TEXT,
+            last_ok INTEGER,
+            duration_seconds REAL,
+            bytes_estimate INTEGER,
+            PRIMARY KEY(subset_total, subset_index)
+        )
+        """
+    )
+    cur.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS catalog_runs (
+            run_id TEXT PRIMARY KEY,
+            type TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            host TEXT,
+            scopes_json TEXT NOT NULL,
+            snapshot_id TEXT,
+            ok INTEGER NOT NULL,
+            total_size INTEGER NOT NULL,
+            manifest_path TEXT NOT NULL,
+            manifest_json TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_catalog_runs_timestamp ON catalog_runs(timestamp);
+        CREATE TABLE IF NOT EXISTS catalog_run_apps (
+            run_id TEXT NOT NULL,
+            app TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            PRIMARY KEY(run_id, app)
+        );
+        CREATE INDEX IF NOT EXISTS idx_catalog_run_apps_app_ts ON catalog_run_apps(app, timestamp);
+        CREATE TABLE IF NOT EXISTS catalog_artifacts (
+            run_id TEXT NOT NULL,
+            app TEXT,
+            type TEXT NOT NULL,
+            path TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            sha256 TEXT,
+            timestamp TEXT NOT NULL,
+            PRIMARY KEY(run_id, path)
+        );
+        CREATE INDEX IF NOT EXISTS idx_catalog_artifacts_app_type_ts ON catalog_artifacts(app, type, timestamp);
+        CREATE INDEX IF NOT EXISTS idx_catalog_artifacts_type_ts ON catalog_artifacts(type, timestamp);
+        CREATE INDEX IF NOT EXISTS idx_catalog_artifacts_size ON catalog_artifacts(size);
+        CREATE TABLE IF NOT EXISTS catalog_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS change_fingerprints (
+            app TEXT NOT NULL,
+            scope TEXT NOT NULL,
+            fingerprint TEXT NOT NULL,
+            run_id TEXT NOT NULL,
+            produced_at TEXT NOT NULL,
+            artifact_json TEXT NOT NULL,
+            PRIMARY KEY(app, scope)
+        );
+        CREATE TABLE IF NOT EXISTS restore_drills (
+            job_id TEXT NOT NULL,
+            app TEXT NOT NULL,
+            run_id TEXT NOT NULL,
+            target TEXT NOT NULL,
+            started_at TEXT NOT NULL,
+            ok INTEGER NOT NULL,
+            fetch_seconds REAL,
+            decompress_seconds REAL,
+            provision_seconds REAL,
+            load_seconds REAL,
+            sanity_seconds REAL,
+            rto_seconds REAL,
+            rto_objective_seconds REAL,
+            bytes INTEGER,
+            error TEXT,
+            details_json TEXT NOT NULL,
+            PRIMARY KEY(job_id, app)
+        );
+        CREATE INDEX IF NOT EXISTS idx_restore_drills_app_started ON restore_drills(app, started_at);
+        """
+    )
+    ensure_columns(cur, "catalog_artifacts", {"ref_run_id": "TEXT", "skip_reason": "TEXT"})
+    for table in ["catalog_runs", "catalog_run_apps", "catalog_artifacts"]:
+        cur.execute(f"SELECT DISTINCT timestamp FROM {table} WHERE timestamp NOT LIKE '%.______+00:00'")
+        for (ts,) in cur.fetchall():
+            try:
+                cur.execute(f"UPDATE {table} SET timestamp=? WHERE timestamp=?", (catalog_time(ts), ts))
+            except ValueError:
+                continue
     con.commit()
     con.close()
 
 
+def db_query(sql: str, params: List[Any]) -> List[Dict[str, Any]]:
+    con = sqlite3.connect(DB_META)
+    con.row_factory = sqlite3.Row
+    cur = con.cursor()
+    cur.execute(sql, params)
+    rows = [dict(r) for r in cur.fetchall()]
+    con.close()
+    return rows
+
+
 def persist_run(job_id: str, action: str, status: str, payload: Dict[str, Any]) -> None:
     con = sqlite3.connect(DB_META)
     cur = con.cursor()
@@ -262,10 +449,253 @@ def list_app_paths(app_cfg: Dict[str, Any]) -> List[Path]:
     return sorted(set(paths))
 
 
+def catalog_time(value: str) -> str:
+    # one fixed UTC layout so stored timestamps and filters compare correctly as strings
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f+00:00")
+
+
+def catalog_bound(value: Optional[str], end_of_day: bool = False) -> Optional[str]:
+    if value is None:
+        return None
+    try:
+        if len(value) == 10:
+            # date only: whole day, inclusive at both ends
+            day = datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+            return catalog_time((day + timedelta(days=1, microseconds=-1) if end_of_day else day).isoformat())
+        return catalog_time(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"invalid ISO date/time: {value}")
+
+
+def catalog_ingest(con: sqlite3.Connection, manifest: Dict[str, Any], manifest_path: Path) -> None:
+    run_id = manifest["job_id"]
+    ts = catalog_time(manifest.get("timestamp") or now_iso())
+    artifacts = manifest.get("artifacts", [])
+    cur = con.cursor()
+    cur.execute(
+        """
+        INSERT OR REPLACE INTO catalog_runs(run_id, type, timestamp, host, scopes_json, snapshot_id, ok, total_size, manifest_path, manifest_json)
+        VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            run_id,
+            manifest.get("type", "backup"),
+            ts,
+            manifest.get("host"),
+            json.dumps(manifest.get("scopes", [])),
+            (manifest.get("restic") or {}).get("snapshot_id"),
+            int(bool((manifest.get("validation") or {}).get("ok", True))),
+            sum(int(a.get("size", 0)) for a in artifacts if not a.get("ref_run_id")),
+            str(manifest_path),
+            json.dumps(manifest),
+        ),
+    )
+    cur.execute("DELETE FROM catalog_run_apps WHERE run_id=?", (run_id,))
+    cur.executemany(
+        "INSERT OR IGNORE INTO catalog_run_apps(run_id, app, timestamp) VALUES(?, ?, ?)",
+        [(run_id, app_key, ts) for app_key in manifest.get("apps", [])],
+    )
+    cur.execute("DELETE FROM catalog_artifacts WHERE run_id=?", (run_id,))
+    cur.executemany(
+        """
+        INSERT OR REPLACE INTO catalog_artifacts(run_id, app, type, path, size, sha256, timestamp, ref_run_id, skip_reason)
+        VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (run_id, a.get("app"), a["type"], a["path"], int(a.get("size", 0)), a.get("sha256"), ts, a.get("ref_run_id"), a.get("skip_reason"))
+            for a in artifacts
+        ],
+    )
+
+
+def catalog_record_run(manifest: Dict[str, Any], manifest_path: Path) -> None:
+    con = sqlite3.connect(DB_META)
+    catalog_ingest(con, manifest, manifest_path)
+    con.commit()
+    con.close()
+
+
+def catalog_backfill() -> int:
+    """Ingest every manifest already on disk; runs once per metadata DB."""
+    con = sqlite3.connect(DB_META)
+    cur = con.cursor()
+    cur.execute("SELECT value FROM catalog_meta WHERE key='backfilled_at'")
+    if cur.fetchone():
+        con.close()
+        return 0
+    count = 0
+    for mp in sorted(RUNS_META.glob("*/manifest.json")):
+        try:
+            catalog_ingest(con, json.loads(mp.read_text(encoding="utf-8")), mp)
+            count += 1
+        except Exception:
+            continue
+    cur.execute("INSERT OR REPLACE INTO catalog_meta(key, value) VALUES('backfilled_at', ?)", (now_iso(),))
+    con.commit()
+    con.close()
+    return count
+
+
+def catalog_runs(
+    app: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    limit: int = 100,
+    with_manifest: bool = False,
+) -> List[Dict[str, Any]]:
+    columns = "r.run_id, r.type, r.timestamp, r.host, r.scopes_json, r.snapshot_id, r.ok, r.total_size, r.manifest_path"
+    if with_manifest:
+        columns += ", r.manifest_json"
+    where, params = [], []
+    if app:
+        where.append("r.run_id IN (SELECT run_id FROM catalog_run_apps WHERE app=?)")
+        params.append(app)
+    since, until = catalog_bound(since), catalog_bound(until, end_of_day=True)
+    if since:
+        where.append("r.timestamp >= ?")
+        params.append(since)
+    if until:
+        where.append("r.timestamp <= ?")
+        params.append(until)
+    sql = f"SELECT {columns} FROM catalog_runs r"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY r.timestamp DESC LIMIT ?"
+    return db_query(sql, params + [limit])
+
+
+def catalog_artifacts(
+    app: Optional[str] = None,
+    artifact_type: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    min_size: Optional[int] = None,
+    max_size: Optional[int] = None,
+    ok_only: bool = False,
+    limit: int = 500,
+) -> List[Dict[str, Any]]:
+    where, params = [], []
+    since, until = catalog_bound(since), catalog_bound(until, end_of_day=True)
+    for clause, value in [
+        ("a.app = ?", app),
+        ("a.type = ?", artifact_type),
+        ("a.timestamp >= ?", since),
+        ("a.timestamp <= ?", until),
+        ("a.size >= ?", min_size),
+        ("a.size <= ?", max_size),
+    ]:
+        if value is not None:
+            where.append(clause)
+            params.append(value)
+    if ok_only:
+        where.append("r.ok = 1")
+    sql = (
+        "SELECT a.run_id, a.app, a.type, a.path, a.size, a.sha256, a.timestamp, a.ref_run_id, a.skip_reason, r.snapshot_id, r.ok "
+        "FROM catalog_artifacts a JOIN catalog_runs r ON r.run_id = a.run_id"
+    )
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY a.timestamp DESC LIMIT ?"
+    return db_query(sql, params + [limit])
+
+
+def catalog_latest_run_id() -> Optional[str]:
+    rows = db_query("SELECT run_id FROM catalog_runs ORDER BY timestamp DESC LIMIT 1", [])
+    return rows[0]["run_id"] if rows else None
+
+
+def db_fingerprint(app_key: str, cfg: Dict[str, Any], log_path: Path) -> Optional[str]:
+    out = shell(
+        [
+            "docker",
+            "exec",
+            cfg["db_container"],
+            "psql",
+            "-U",
+            cfg.get("db_user", "postgres"),
+            "-d",
+            cfg.get("db_name", app_key),
+            "-tAc",
+            DB_FINGERPRINT_SQL,
+        ],
+        check=False,
+        log_path=log_path,
+    )
+    raw = out.stdout.strip()
+    if out.returncode != 0 or not raw or raw.split("|", 1)[0] != "0":
+        return None
+    return "pgwal:" + hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def tree_fingerprint(paths: List[Path]) -> str:
+    h = hashlib.sha256()
+    for root in paths:
+        h.update(f"root\0{root}\n".encode("utf-8"))
+        entries = [root] if not root.is_dir() else []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            entries += [Path(dirpath) / name for name in sorted(dirnames + filenames)]
+        for entry in entries:
+            try:
+                st = os.lstat(entry)
+            except OSError:
+                continue
+            h.update(f"{entry}\0{st.st_mode}\0{st.st_size}\0{st.st_mtime_ns}\0{st.st_ctime_ns}\0{st.st_ino}\n".encode("utf-8"))
+    return "tree:" + h.hexdigest()
+
+
+def load_fingerprints() -> Dict[tuple, Dict[str, Any]]:
+    con = sqlite3.connect(DB_META)
+    cur = con.cursor()
+    cur.execute("SELECT app, scope, fingerprint, run_id, produced_at, artifact_json FROM change_fingerprints")
+    rows = {
+        (r[0], r[1]): {"fingerprint": r[2], "run_id": r[3], "produced_at": r[4], "artifact": json.loads(r[5])}
+        for r in cur.fetchall()
+    }
+    con.close()
+    return rows
+
+
+def record_fingerprints(job_id: str, artifacts: List[Dict[str, Any]]) -> None:
+    fresh = [a for a in artifacts if a["type"] in ["db", "files"] and not a.get("ref_run_id")]
+    rows = [
+        (a["app"], a["type"], a["fingerprint"], job_id, now_iso(), json.dumps({k: v for k, v in a.items() if k != "fingerprint"}))
+        for a in fresh
+        if a.get("fingerprint")
+    ]
+    # a fresh artifact without a fingerprint supersedes the old one; never skip back to it
+    stale = [(a["app"], a["type"]) for a in fresh if not a.get("fingerprint")]
+    con = sqlite3.connect(DB_META)
+    con.executemany("INSERT OR REPLACE INTO change_fingerprints(app, scope, fingerprint, run_id, produced_at, artifact_json) VALUES(?, ?, ?, ?, ?, ?)", rows)
+    con.executemany("DELETE FROM change_fingerprints WHERE app = ? AND scope = ?", stale)
+    con.commit()
+    con.close()
+
+
+def carried_over_artifact(previous: Optional[Dict[str, Any]], fingerprint: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not previous or not fingerprint or previous["fingerprint"] != fingerprint:
+        return None
+    # force a fresh artifact now and then so references never point far back
+    age = datetime.now(timezone.utc) - datetime.fromisoformat(previous["produced_at"])
+    if age.days >= CHANGE_SKIP_MAX_AGE_DAYS:
+        return None
+    return {
+        **previous["artifact"],
+        "fingerprint": fingerprint,
+        "ref_run_id": previous["run_id"],
+        "skip_reason": f"unchanged since run {previous['run_id']} (fingerprint match)",
+    }
+
+
 def backup_job(job_id: str, payload: Dict[str, Any], log_path: Path) -> Dict[str, Any]:
     ensure_restic_init()
     apps = resolve_apps(payload.get("apps"))
     scopes = payload.get("scopes") or ["db", "files", "env", "caddy"]
+    skip_unchanged = bool(payload.get("skip_unchanged", False))
+    previous = load_fingerprints() if skip_unchanged else {}
     host = os.uname().nodename
 
     run_root = BACKUP_WORK / job_id
@@ -283,6 +713,7 @@ def backup_job(job_id: str, payload: Dict[str, Any], log_path: Path) -> Dict[str
         "apps": list(apps.keys()),
         "scopes": scopes,
         "host": host,
+        "skip_unchanged": skip_unchanged,
         "artifacts": [],
         "validation": {"ok": True, "checks": []},
         "restic": {},
@@ -292,34 +723,50 @@ def backup_job(job_id: str, payload: Dict[str, Any], log_path: Path) -> Dict[str
 
     for app_key, cfg in apps.items():
         if "db" in scopes and cfg.get("db_container"):
-            db_file = db_dir / f"{app_key}.sql.gz"
-            dump_cmd = (
-                f"docker exec {cfg['db_container']} pg_dump -U {cfg.get('db_user','postgres')} {cfg.get('db_name', app_key)} | gzip -c > {db_file}"
-            )
-            shell(["bash", "-lc", dump_cmd], log_path=log_path)
-            shell(["gunzip", "-t", str(db_file)], log_path=log_path)
-            manifest["artifacts"].append({
-                "type": "db",
-                "app": app_key,
-                "path": str(db_file),
-                "size": db_file.stat().st_size,
-                "sha256": sha256_file(db_file),
-            })
+            # fingerprint before dumping so writes racing the dump show up next run
+            fingerprint = db_fingerprint(app_key, cfg, log_path) if skip_unchanged else None
+            reused = carried_over_artifact(previous.get((app_key, "db")), fingerprint)
+            if reused:
+                manifest["artifacts"].append(reused)
+            else:
+                db_file = db_dir / f"{app_key}.sql.gz"
+                dump_cmd = (
+                    f"docker exec {cfg['db_container']} pg_dump -U {cfg.get('db_user','postgres')} {cfg.get('db_name', app_key)} | gzip -c > {db_file}"
+                )
+                shell(["bash", "-lc", dump_cmd], log_path=log_path)
+                shell(["gunzip", "-t", str(db_file)], log_path=log_path)
+                artifact = {
+                    "type": "db",
+                    "app": app_key,
+                    "path": str(db_file),
+                    "size": db_file.stat().st_size,
+                    "sha256": sha256_file(db_file),
+                }
+                if fingerprint:
+                    artifact["fingerprint"] = fingerprint
+                manifest["artifacts"].append(artifact)
 
         if "files" in scopes:
             app_paths = list_app_paths(cfg)
-            if app_paths:
+            fingerprint = tree_fingerprint(app_paths) if skip_unchanged and app_paths else None
+            reused = carried_over_artifact(previous.get((app_key, "files")), fingerprint)
+            if reused:
+                manifest["artifacts"].append(reused)
+            elif app_paths:
                 bundle = files_dir / f"{app_key}_files.tar.zst"
                 shell(["tar", "--zstd", "-cf", str(bundle)] + [str(p) for p in app_paths], log_path=log_path)
                 shell(["zstd", "-t", str(bundle)], log_path=log_path)
                 shell(["tar", "-tf", str(bundle)], log_path=log_path)
-                manifest["artifacts"].append({
+                artifact = {
                     "type": "files",
                     "app": app_key,
                     "path": str(bundle),
                     "size": bundle.stat().st_size,
                     "sha256": sha256_file(bundle),
-                })
+                }
+                if fingerprint:
+                    artifact["fingerprint"] = fingerprint
+                manifest["artifacts"].append(artifact)
 
         if "env" in scopes:
             env_files = [Path(p) for p in (cfg.get("env_files") or []) if Path(p).exists()]
@@ -371,6 +818,10 @@ def backup_job(job_id: str, payload: Dict[str, Any], log_path: Path) -> Dict[str
     with (run_meta_dir / "checksums.sha256").open("w", encoding="utf-8") as fh:
         for item in manifest["artifacts"]:
             fh.write(f"{item['sha256']}  {item['path']}\n")
+    catalog_record_run(manifest, manifest_path)
+    record_fingerprints(job_id, manifest["artifacts"])
+
+    PRUNE_PLAN_FILE.unlink(missing_ok=True)
 
     for app_key in apps.keys():
         metric_backup_success.labels(app=app_key).set(1)
@@ -379,6 +830,157 @@ def backup_job(job_id: str, payload: Dict[str, Any], log_path: Path) -> Dict[str
     return {"manifest": str(manifest_path), "snapshot_id": snapshot, "work_dir": str(run_root)}
 
 
+def repo_data_bytes() -> int:
+    total = 0
+    for root, _, files in os.walk(BACKUP_REPO / "data"):
+        for name in files:
+            try:
+                total += os.stat(os.path.join(root, name)).st_size
+            except OSError:
+                continue
+    return total
+
+
+def verify_schedule(subset_total: int) -> List[Dict[str, Any]]:
+    """All subsets of the rotation, least recently verified first (never-verified first of all)."""
+    con = sqlite3.connect(DB_META)
+    cur = con.cursor()
+    cur.execute(
+        "SELECT subset_index, verified_at, last_attempt_at, last_ok, duration_seconds FROM verify_subsets WHERE subset_total=?",
+        (subset_total,),
+    )
+    rows = {r[0]: r for r in cur.fetchall()}
+    con.close()
+    schedule = []
+    for n in range(1, subset_total + 1):
+        row = rows.get(n)
+        schedule.append({
+            "subset": f"{n}/{subset_total}",
+            "index": n,
+            "verified_at": row[1] if row else None,
+            "last_attempt_at": row[2] if row else None,
+            "last_ok": bool(row[3]) if row and row[3] is not None else None,
+            "duration_seconds": row[4] if row else None,
+        })
+    schedule.sort(key=lambda x: (x["verified_at"] is not None, x["verified_at"] or "", x["index"]))
+    return schedule
+
+
+def record_verify_subset(subset_total: int, subset_index: int, job_id: str, ok: bool, duration: float, bytes_estimate: int) -> None:
+    ts = now_iso()
+    con = sqlite3.connect(DB_META)
+    cur = con.cursor()
+    cur.execute(
+        """
+        INSERT INTO verify_subsets(subset_total, subset_index, verified_at, verified_job_id, last_attempt_at, last_ok, duration_seconds, bytes_estimate)
+        VALUES(?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(subset_total, subset_index) DO UPDATE SET
+          verified_at=COALESCE(excluded.verified_at, verify_subsets.verified_at),
+          verified_job_id=COALESCE(excluded.verified_job_id, verify_subsets.verified_job_id),
+          last_attempt_at=excluded.last_attempt_at,
+          last_ok=excluded.last_ok,
+          duration_seconds=excluded.duration_seconds,
+          bytes_estimate=excluded.bytes_estimate
+        """,
+        (subset_total, subset_index, ts if ok else None, job_id if ok else None, ts, int(ok), duration, bytes_estimate),
+    )
+    con.commit()
+    con.close()
+
+
+def verify_coverage(subset_total: int) -> Dict[str, Any]:
+    schedule = verify_schedule(subset_total)
+    verified = [x["verified_at"] for x in schedule if x["verified_at"]]
+    complete = len(verified) == subset_total
+    # until the rotation has covered every subset once, age counts from its first run,
+    # so a fresh deploy or a new subset count is not reported as stale
+    seen = verified + [x["last_attempt_at"] for x in schedule if x["last_attempt_at"]]
+    oldest = min(verified) if complete else (min(seen) if seen else None)
+    age = time.time() - datetime.fromisoformat(oldest).timestamp() if oldest else 0.0
+    return {
+        "subset_total": subset_total,
+        "subsets_covered": len(verified),
+        "complete": complete,
+        "oldest_verified_at": min(verified) if complete else None,
+        "coverage_age_seconds": age,
+        "subsets": sorted(schedule, key=lambda x: x["index"]),
+    }
+
+
+def refresh_verify_metrics() -> None:
+    coverage = verify_coverage(int(load_config_section("verify").get("subsets", VERIFY_SUBSETS)))
+    metric_verify_subsets_total.set(coverage["subset_total"])
+    metric_verify_subsets_covered.set(coverage["subsets_covered"])
+    metric_verify_coverage_age.set(coverage["coverage_age_seconds"])
+    attempts = [x for x in coverage["subsets"] if x["last_attempt_at"]]
+    if attempts:
+        latest = max(attempts, key=lambda x: x["last_attempt_at"])
+        metric_verify_last_success.set(1 if latest["last_ok"] else 0)
+    else:
+        metric_verify_last_success.set(1)
+
+
+def verify_repository(job_id: str, payload: Dict[str, Any], log_path: Path, max_subsets: Optional[int] = None) -> Dict[str, Any]:
+    cfg = load_config_section("verify")
+    subset_total = int(cfg.get("subsets", VERIFY_SUBSETS))
+    time_budget = float(payload.get("time_budget_seconds") or cfg.get("time_budget_seconds", VERIFY_TIME_BUDGET_SECONDS))
+    byte_budget = int(payload.get("byte_budget") or cfg.get("byte_budget", VERIFY_BYTE_BUDGET))
+    subset_bytes = repo_data_bytes() // subset_total
+
+    # at least one subset per run, oldest first, so every subset is read within subset_total runs
+    started = time.monotonic()
+    bytes_read = 0
+    verified: List[Dict[str, Any]] = []
+    output = ""
+    locked = False
+    for item in verify_schedule(subset_total):
+        elapsed = time.monotonic() - started
+        if max_subsets is not None and len(verified) >= max_subsets:
+            break
+        if verified:
+            expected = item["duration_seconds"] or elapsed / len(verified)
+            if elapsed + expected > time_budget or bytes_read + subset_bytes > byte_budget:
+                break
+        t0 = time.monotonic()
+        out = shell(
+            ["restic", "-r", str(BACKUP_REPO), "check", f"--read-data-subset={item['subset']}"],
+            env={"RESTIC_PASSWORD_FILE": str(RESTIC_PASSWORD_FILE)},
+            check=False,
+            log_path=log_path,
+        )
+        duration = time.monotonic() - t0
+        ok = out.returncode == 0
+        if not ok and any(marker in out.stderr for marker in RESTIC_LOCK_ERRORS):
+            # another job (backup/prune) holds the lock: says nothing about the data
+            locked = True
+            break
+        record_verify_subset(subset_total, item["index"], job_id, ok, duration, subset_bytes)
+        bytes_read += subset_bytes
+        output = out.stdout[-1000:]
+        verified.append({"subset": item["subset"], "ok": ok, "duration_seconds": round(duration, 2)})
+        if not ok:
+            refresh_verify_metrics()
+            raise RuntimeError(f"restic check failed for subset {item['subset']}\n{out.stderr[-1000:]}")
+
+    if locked and not verified:
+        raise RuntimeError("repository locked by another job; no subset verified")
+    refresh_verify_metrics()
+    coverage = verify_coverage(subset_total)
+    return {
+        "restic": output,
+        "verification": {
+            "subsets": verified,
+            "stopped_on_lock": locked,
+            "bytes_estimate": bytes_read,
+            "time_budget_seconds": time_budget,
+            "byte_budget": byte_budget,
+            "subsets_covered": coverage["subsets_covered"],
+            "subset_total": subset_total,
+            "coverage_age_seconds": coverage["coverage_age_seconds"],
+        },
+    }
+
+
 def validate_job(job_id: str, payload: Dict[str, Any], log_path: Path) -> Dict[str, Any]:
     run_id = payload.get("run_id")
     if run_id:
@@ -389,38 +991,236 @@ def validate_job(job_id: str, payload: Dict[str, Any], log_path: Path) -> Dict[s
         checks = []
         for artifact in manifest.get("artifacts", []):
             p = Path(artifact["path"])
+            if artifact.get("ref_run_id") and not p.exists():
+                checks.append({"path": artifact["path"], "ok": None, "ref_run_id": artifact["ref_run_id"], "skip_reason": artifact.get("skip_reason")})
+                continue
             ok = p.exists() and sha256_file(p) == artifact["sha256"]
             checks.append({"path": artifact["path"], "ok": ok})
             if p.suffix == ".gz":
                 shell(["gunzip", "-t", str(p)], log_path=log_path)
             if p.suffixes[-2:] == [".tar", ".zst"] or str(p).endswith(".tar.zst"):
                 shell(["zstd", "-t", str(p)], log_path=log_path)
-        out = shell(["restic", "-r", str(BACKUP_REPO), "check", "--read-data-subset=1/20"], env={"RESTIC_PASSWORD_FILE": str(RESTIC_PASSWORD_FILE)}, log_path=log_path)
-        return {"run_id": run_id, "checks": checks, "restic": out.stdout[-1000:]}
+        # run-scoped validation reads a single subset, not the nightly budget
+        return {"run_id": run_id, "checks": checks, **verify_repository(job_id, payload, log_path, max_subsets=1)}
 
-    out = shell(["restic", "-r", str(BACKUP_REPO), "check", "--read-data-subset=1/20"], env={"RESTIC_PASSWORD_FILE": str(RESTIC_PASSWORD_FILE)}, log_path=log_path)
-    return {"restic": out.stdout[-1000:]}
+    return verify_repository(job_id, payload, log_path)
 
 
-def prune_job(job_id: str, payload: Dict[str, Any], log_path: Path) -> Dict[str, Any]:
+def list_snapshots(log_path: Optional[Path] = None) -> List[Dict[str, Any]]:
     out = shell(
-        [
-            "restic",
-            "-r",
-            str(BACKUP_REPO),
-            "forget",
-            "--keep-daily",
-            str(RETENTION["daily"]),
-            "--keep-weekly",
-            str(RETENTION["weekly"]),
-            "--keep-monthly",
-            str(RETENTION["monthly"]),
-            "--prune",
-        ],
+        ["restic", "-r", str(BACKUP_REPO), "snapshots", "--json"],
         env={"RESTIC_PASSWORD_FILE": str(RESTIC_PASSWORD_FILE)},
         log_path=log_path,
     )
-    return {"output": out.stdout[-2000:]}
+    return json.loads(out.stdout or "[]") or []
+
+
+def snapshot_time(snap: Dict[str, Any]) -> datetime:
+    return datetime.fromisoformat(snap["time"])
+
+
+def snapshot_tag_values(snap: Dict[str, Any], prefix: str) -> List[str]:
+    return sorted(t[len(prefix):] for t in (snap.get("tags") or []) if t.startswith(prefix))
+
+
+def resolve_retention(retention_cfg: Dict[str, Any], app_cfg: Optional[Dict[str, Any]], scope: str) -> Dict[str, int]:
+    # precedence: built-in default < global default < global scope < app < app scope
+    app_retention = (app_cfg or {}).get("retention") or {}
+    layers = [
+        retention_cfg.get("default"),
+        (retention_cfg.get("scopes") or {}).get(scope),
+        {k: v for k, v in app_retention.items() if k != "scopes"},
+        (app_retention.get("scopes") or {}).get(scope),
+    ]
+    policy = dict(RETENTION)
+    for layer in layers:
+        for key, value in (layer or {}).items():
+            if key not in RETENTION_KEYS:
+                raise RuntimeError(f"unknown retention key '{key}'")
+            policy[key] = int(value)
+    return policy
+
+
+def apply_retention(snaps: List[Dict[str, Any]], policy: Dict[str, int]) -> Dict[str, str]:
+    """Return {snapshot_id: reason} for snapshots kept by policy; snaps must be newest first."""
+    keep: Dict[str, str] = {}
+    if snaps:
+        # never forget the newest snapshot of a group, whatever the policy says
+        keep[snaps[0]["id"]] = "latest"
+    for snap in snaps[: policy.get("last", 0)]:
+        keep.setdefault(snap["id"], "last")
+    for unit, fmt in RETENTION_BUCKETS:
+        limit = policy.get(unit, 0)
+        seen = set()
+        for snap in snaps:
+            if len(seen) >= limit:
+                break
+            bucket = snapshot_time(snap).strftime(fmt)
+            if bucket in seen:
+                continue
+            seen.add(bucket)
+            keep.setdefault(snap["id"], unit)
+    return keep
+
+
+def run_artifact_bytes(run_id: str) -> int:
+    manifest_path = RUNS_META / run_id / "manifest.json"
+    if not manifest_path.exists():
+        return 0
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except Exception:
+        return 0
+    return sum(int(a.get("size", 0)) for a in manifest.get("artifacts", []) if not a.get("ref_run_id"))
+
+
+def referenced_run_ids(run_ids: List[str]) -> List[str]:
+    if not run_ids:
+        return []
+    rows = db_query(
+        f"SELECT DISTINCT ref_run_id FROM catalog_artifacts WHERE ref_run_id IS NOT NULL AND run_id IN ({','.join('?' for _ in run_ids)})",
+        list(run_ids),
+    )
+    return [r["ref_run_id"] for r in rows]
+
+
+def retention_fingerprint(retention_cfg: Dict[str, Any], apps: Dict[str, Dict[str, Any]]) -> str:
+    src = {"retention": retention_cfg, "apps": {k: v.get("retention") for k, v in apps.items()}}
+    return hashlib.sha256(json.dumps(src, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def build_prune_plan(log_path: Optional[Path] = None) -> Dict[str, Any]:
+    snaps = list_snapshots(log_path)
+    apps = load_apps()
+    retention_cfg = load_config_section("retention")
+
+    # a snapshot holding several apps is evaluated in each app's group and
+    # survives if any of those policies keeps it
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for snap in snaps:
+        scope = (snapshot_tag_values(snap, "scope:") or ["full"])[0]
+        for app_key in snapshot_tag_values(snap, "app:") or [""]:
+            groups.setdefault((snap.get("hostname", ""), app_key, scope), []).append(snap)
+
+    keep_reasons: Dict[str, List[str]] = {}
+    policies: Dict[str, Dict[str, int]] = {}
+    for (_, app_key, scope), members in sorted(groups.items()):
+        members.sort(key=snapshot_time, reverse=True)
+        label = f"{app_key or '-'}/{scope}"
+        policy = resolve_retention(retention_cfg, apps.get(app_key), scope)
+        policies[label] = policy
+        for snap_id, reason in apply_retention(members, policy).items():
+            keep_reasons.setdefault(snap_id, []).append(f"{label}:{reason}")
+
+    # runs that skipped unchanged data point at an earlier run's artifacts; keep those snapshots too
+    kept_runs = [r for snap in snaps if snap["id"] in keep_reasons for r in snapshot_tag_values(snap, "run:")]
+    needed = set(referenced_run_ids(kept_runs))
+    # the next skip_unchanged backup may point at any run still in change_fingerprints
+    skip_bases = {row["run_id"] for row in load_fingerprints().values()}
+    for snap in snaps:
+        for run_id in snapshot_tag_values(snap, "run:"):
+            if run_id in needed:
+                keep_reasons.setdefault(snap["id"], []).append(f"referenced:{run_id}")
+            if run_id in skip_bases:
+                keep_reasons.setdefault(snap["id"], []).append(f"skip_base:{run_id}")
+
+    forget = []
+    for snap in sorted(snaps, key=snapshot_time):
+        if snap["id"] in keep_reasons:
+            continue
+        run_ids = snapshot_tag_values(snap, "run:")
+        forget.append({
+            "id": snap["id"],
+            "short_id": snap.get("short_id"),
+            "time": snap["time"],
+            "run_id": run_ids[0] if run_ids else None,
+            "apps": snapshot_tag_values(snap, "app:"),
+            "scope": (snapshot_tag_values(snap, "scope:") or ["full"])[0],
+            "estimated_bytes": run_artifact_bytes(run_ids[0]) if run_ids else 0,
+        })
+
+    return {
+        "generated_at": now_iso(),
+        "retention_fingerprint": retention_fingerprint(retention_cfg, apps),
+        "snapshots_total": len(snaps),
+        "keep_total": len(keep_reasons),
+        "forget_total": len(forget),
+        # upper bound: chunks shared with kept snapshots are not reclaimed by a repack
+        "estimated_reclaim_bytes": sum(item["estimated_bytes"] for item in forget),
+        "policies": policies,
+        "keep": [{"id": k, "reasons": v} for k, v in sorted(keep_reasons.items())],
+        "forget": forget,
+    }
+
+
+def load_prune_plan(refresh: bool = False) -> Dict[str, Any]:
+    if not refresh and PRUNE_PLAN_FILE.exists():
+        if time.time() - PRUNE_PLAN_FILE.stat().st_mtime < PRUNE_PLAN_TTL_SECONDS:
+            try:
+                plan = json.loads(PRUNE_PLAN_FILE.read_text(encoding="utf-8"))
+            except Exception:
+                plan = {}
+            # new snapshots/forgets drop the file; a policy edit in apps.yml is caught here
+            if plan.get("retention_fingerprint") == retention_fingerprint(load_config_section("retention"), load_apps()):
+                plan["cached"] = True
+                return plan
+    plan = build_prune_plan()
+    PRUNE_PLAN_FILE.write_text(json.dumps(plan, indent=2), encoding="utf-8")
+    plan["cached"] = False
+    return plan
+
+
+def prune_job(job_id: str, payload: Dict[str, Any], log_path: Path) -> Dict[str, Any]:
+    mode = payload.get("mode") or "routine"
+    if mode not in PRUNE_MODES:
+        raise RuntimeError("unsupported mode")
+    # always plan against a fresh snapshot listing; the cached plan is for display only
+    plan = build_prune_plan(log_path)
+    PRUNE_PLAN_FILE.write_text(json.dumps(plan, indent=2), encoding="utf-8")
+    result: Dict[str, Any] = {
+        "mode": mode,
+        "dry_run": bool(payload.get("dry_run", False)),
+        "forget_total": plan["forget_total"],
+        "estimated_reclaim_bytes": plan["estimated_reclaim_bytes"],
+    }
+    if result["dry_run"]:
+        result["plan"] = plan
+        return result
+
+    if mode in ["forget", "routine"]:
+        ids = [item["id"] for item in plan["forget"]]
+        for i in range(0, len(ids), 100):
+            shell(
+                ["restic", "-r", str(BACKUP_REPO), "forget"] + ids[i : i + 100],
+                env={"RESTIC_PASSWORD_FILE": str(RESTIC_PASSWORD_FILE)},
+                log_path=log_path,
+            )
+        result["forgotten"] = ids
+
+    if mode in ["repack", "routine"]:
+        repack_cfg = load_config_section("retention").get("repack") or {}
+        max_unused = payload.get("max_unused") or repack_cfg.get("max_unused") or PRUNE_MAX_UNUSED
+        max_repack_size = payload.get("max_repack_size") or repack_cfg.get("max_repack_size") or PRUNE_MAX_REPACK_SIZE
+        out = shell(
+            [
+                "restic",
+                "-r",
+                str(BACKUP_REPO),
+                "prune",
+                "--max-unused",
+                str(max_unused),
+                "--max-repack-size",
+                str(max_repack_size),
+            ],
+            env={"RESTIC_PASSWORD_FILE": str(RESTIC_PASSWORD_FILE)},
+            log_path=log_path,
+        )
+        result["max_unused"] = str(max_unused)
+        result["max_repack_size"] = str(max_repack_size)
+        result["output"] = out.stdout[-2000:]
+
+    PRUNE_PLAN_FILE.unlink(missing_ok=True)
+    return result
 
 
 def ensure_restore_source(run_id: str, log_path: Path) -> Path:
@@ -433,15 +1233,39 @@ def ensure_restore_source(run_id: str, log_path: Path) -> Path:
         env={"RESTIC_PASSWORD_FILE": str(RESTIC_PASSWORD_FILE)},
         log_path=log_path,
     )
-    restored = temp_target / "srv" / "backups" / "work" / run_id
+    restored = temp_target / BACKUP_WORK.relative_to("/") / run_id
     if not restored.exists():
         raise RuntimeError("restored run directory not found")
     return restored
 
 
-def restore_db(run_dir: Path, apps: Dict[str, Dict[str, Any]], log_path: Path, force_same_server: bool) -> None:
+def carried_over_sources(run_id: str, log_path: Path) -> Dict[tuple, Path]:
+    """Map (type, app) of artifacts a run carried over from an earlier run to their restored location."""
+    manifest_path = RUNS_META / run_id / "manifest.json"
+    if not manifest_path.exists():
+        return {}
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    ref_dirs: Dict[str, Path] = {}
+    sources: Dict[tuple, Path] = {}
+    for artifact in manifest.get("artifacts", []):
+        ref = artifact.get("ref_run_id")
+        if not ref:
+            continue
+        if ref not in ref_dirs:
+            ref_dirs[ref] = ensure_restore_source(ref, log_path)
+        sources[(artifact["type"], artifact.get("app"))] = ref_dirs[ref] / Path(artifact["path"]).relative_to(BACKUP_WORK / ref)
+    return sources
+
+
+def restore_db(
+    run_dir: Path,
+    apps: Dict[str, Dict[str, Any]],
+    log_path: Path,
+    force_same_server: bool,
+    sources: Optional[Dict[tuple, Path]] = None,
+) -> None:
     for app_key, cfg in apps.items():
-        dump_file = run_dir / "db" / f"{app_key}.sql.gz"
+        dump_file = (sources or {}).get(("db", app_key)) or run_dir / "db" / f"{app_key}.sql.gz"
         if not dump_file.exists():
             continue
         if not force_same_server:
@@ -458,8 +1282,10 @@ def restore_db(run_dir: Path, apps: Dict[str, Dict[str, Any]], log_path: Path, f
         shell(["bash", "-lc", restore_cmd], log_path=log_path)
 
 
-def restore_files(run_dir: Path, log_path: Path) -> None:
-    for archive in (run_dir / "files").glob("*_files.tar.zst"):
+def restore_files(run_dir: Path, log_path: Path, sources: Optional[Dict[tuple, Path]] = None) -> None:
+    archives = list((run_dir / "files").glob("*_files.tar.zst"))
+    archives += [p for (kind, _), p in (sources or {}).items() if kind == "files"]
+    for archive in archives:
         shell(["tar", "--zstd", "-xf", str(archive), "-P"], log_path=log_path)
 
 
@@ -482,6 +1308,9 @@ def export_bundle_job(job_id: str, payload: Dict[str, Any], log_path: Path) -> D
     bundle_dir = Path(tempfile.mkdtemp(prefix=f"bundle-{run_id}-", dir="/tmp"))
     dest_dir = bundle_dir / f"restore_bundle_{run_id}"
     shutil.copytree(run_dir, dest_dir, dirs_exist_ok=True)
+    for src in carried_over_sources(run_id, log_path).values():
+        (dest_dir / src.parent.name).mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src, dest_dir / src.parent.name / src.name)
     write_restore_guide(dest_dir / "RESTORE_GUIDE.md", run_id)
     out_file = BACKUP_META / f"restore_bundle_{run_id}.tar.zst"
     shell(["tar", "--zstd", "-cf", str(out_file), "-C", str(bundle_dir), dest_dir.name], log_path=log_path)
@@ -508,15 +1337,314 @@ def restore_job(job_id: str, payload: Dict[str, Any], log_path: Path) -> Dict[st
 
     if mode == "validate-only":
         return validate_job(job_id, {"run_id": run_id}, log_path)
+    sources = carried_over_sources(run_id, log_path) if mode in ["restore-db", "restore-files", "full"] else {}
     if mode in ["restore-db", "full"]:
-        restore_db(run_dir, apps, log_path, allow_same_server)
+        restore_db(run_dir, apps, log_path, allow_same_server, sources)
     if mode in ["restore-files", "full"]:
-        restore_files(run_dir, log_path)
+        restore_files(run_dir, log_path, sources)
     if mode in ["restore-caddy", "full"]:
         restore_caddy(run_dir, log_path)
     return {"restored_mode": mode, "run_id": run_id}
 
 
+class DrillDatabase:
+    """Throwaway Postgres for a restore drill: a docker container or a local initdb cluster."""
+
+    def __init__(self, name: str, root: Path, app_key: str, cfg: Dict[str, Any], target: str, drill_cfg: Dict[str, Any], log_path: Path):
+        self.name = name
+        self.root = root
+        self.user = cfg.get("db_user", "postgres")
+        self.db = cfg.get("db_name", app_key)
+        self.target = target
+        app_drill = cfg.get("restore_drill") or {}
+        self.source_container = cfg.get("db_container")
+        self.pg_image = app_drill.get("pg_image")
+        self.fallback_image = drill_cfg.get("pg_image", RESTORE_DRILL_PG_IMAGE)
+        pg_bin_dir = app_drill.get("pg_bin_dir") or drill_cfg.get("pg_bin_dir")
+        self.pg_bin = Path(pg_bin_dir) if pg_bin_dir else None
+        # initdb/postgres refuse to run as root
+        self.run_as = drill_cfg.get("local_user", "postgres") if os.geteuid() == 0 else None
+        self.log_path = log_path
+        self.pgdata = root / "pgdata"
+
+    def _bin(self, name: str) -> str:
+        return str(self.pg_bin / name) if self.pg_bin else name
+
+    def _local(self, cmd: List[str]) -> List[str]:
+        return (["runuser", "-u", self.run_as, "--"] if self.run_as else []) + cmd
+
+    def psql_cmd(self) -> List[str]:
+        if self.target == "docker":
+            return ["docker", "exec", "-i", self.name, "psql", "-U", self.user, "-d", self.db]
+        return self._local([self._bin("psql"), "-h", str(self.pgdata), "-p", "5432", "-U", self.user, "-d", self.db])
+
+    def resolve_image(self) -> str:
+        # same image (and so Postgres major) as production, unless the app pins one
+        if self.pg_image:
+            return self.pg_image
+        if self.source_container:
+            out = shell(["docker", "inspect", "--format", "{{.Config.Image}}", self.source_container], check=False, log_path=self.log_path)
+            if out.returncode == 0 and out.stdout.strip():
+                return out.stdout.strip()
+        return self.fallback_image
+
+    def start(self) -> None:
+        if self.target == "docker":
+            self.pg_image = self.resolve_image()
+            shell(
+                ["docker", "run", "-d", "--rm", "--name", self.name, "-e", "POSTGRES_PASSWORD=drill", "-e", f"POSTGRES_USER={self.user}", "-e", f"POSTGRES_DB={self.db}", self.pg_image],
+                log_path=self.log_path,
+            )
+            # TCP probe: the image's init-time server listens on the socket only
+            ready = ["docker", "exec", self.name, "pg_isready", "-h", "127.0.0.1", "-U", self.user, "-d", self.db]
+        else:
+            self.pgdata.mkdir(mode=0o700)
+            if self.run_as:
+                shutil.chown(self.root, user=self.run_as)
+                shutil.chown(self.pgdata, user=self.run_as)
+            shell(self._local([self._bin("initdb"), "-D", str(self.pgdata), "-U", self.user, "--auth=trust"]), log_path=self.log_path)
+            shell(
+                self._local([self._bin("pg_ctl"), "-D", str(self.pgdata), "-l", str(self.root / "postgres.log"), "-o", f"-p 5432 -k {self.pgdata} -c listen_addresses=''", "-w", "start"]),
+                log_path=self.log_path,
+            )
+            shell(self._local([self._bin("createdb"), "-h", str(self.pgdata), "-p", "5432", "-U", self.user, self.db]), log_path=self.log_path)
+            ready = self._local([self._bin("pg_isready"), "-h", str(self.pgdata), "-p", "5432"])
+        deadline = time.monotonic() + RESTORE_DRILL_READY_TIMEOUT_SECONDS
+        while shell(ready, check=False).returncode != 0:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"drill database {self.name} not ready")
+            time.sleep(1)
+
+    def create_roles(self, sql_file: Path) -> List[str]:
+        existing = set(self.query("SELECT rolname FROM pg_roles;").splitlines())
+        missing = sorted(dump_roles(sql_file) - existing)
+        for role in missing:
+            self.query('CREATE ROLE "{}";'.format(role.replace('"', '""')))
+        return missing
+
+    def load(self, sql_file: Path) -> None:
+        # any error aborts the load, so a partial restore never counts as a drill result
+        cmd = " ".join(f"'{c}'" for c in self.psql_cmd()) + f" -q -v ON_ERROR_STOP=1 --single-transaction < '{sql_file}'"
+        shell(["bash", "-lc", cmd], log_path=self.log_path)
+
+    def query(self, sql: str) -> str:
+        return shell(self.psql_cmd() + ["-tAc", sql], log_path=self.log_path).stdout.strip()
+
+    def stop(self) -> None:
+        if self.target == "docker":
+            shell(["docker", "rm", "-f", self.name], check=False, log_path=self.log_path)
+        elif self.pgdata.exists():
+            shell(self._local([self._bin("pg_ctl"), "-D", str(self.pgdata), "-m", "immediate", "stop"]), check=False, log_path=self.log_path)
+
+
+def dump_roles(sql_file: Path) -> set:
+    roles = set()
+    with sql_file.open("r", encoding="utf-8", errors="replace") as fh:
+        for line in fh:
+            if not line.startswith(("ALTER ", "GRANT ", "REVOKE ")):
+                continue
+            m = DUMP_ROLE_RE.match(line.rstrip("\n"))
+            if not m:
+                continue
+            for name in m.group(1).split(","):
+                name = name.strip()
+                if name.startswith('"') and name.endswith('"'):
+                    name = name[1:-1].replace('""', '"')
+                elif name.lower() in DUMP_BUILTIN_ROLES:
+                    continue
+                else:
+                    name = name.lower()
+                if name and not name.startswith("pg_"):
+                    roles.add(name)
+    return roles
+
+
+def fetch_drill_artifact(artifact: Dict[str, Any], run_id: str, dest: Path, log_path: Path) -> Path:
+    source_run = artifact.get("ref_run_id") or run_id
+    shell(
+        ["restic", "-r", str(BACKUP_REPO), "restore", "latest", "--tag", f"run:{source_run}", "--target", str(dest), "--include", artifact["path"]],
+        env={"RESTIC_PASSWORD_FILE": str(RESTIC_PASSWORD_FILE)},
+        log_path=log_path,
+    )
+    restored = dest / artifact["path"].lstrip("/")
+    if not restored.exists():
+        raise RuntimeError(f"artifact not found in snapshot: {artifact['path']}")
+    if sha256_file(restored) != artifact["sha256"]:
+        raise RuntimeError(f"checksum mismatch: {artifact['path']}")
+    return restored
+
+
+def drill_app(job_id: str, run_id: str, manifest: Dict[str, Any], app_key: str, cfg: Dict[str, Any], drill_cfg: Dict[str, Any], root: Path, target: str, log_path: Path) -> Dict[str, Any]:
+    app_drill = cfg.get("restore_drill") or {}
+    app_root = root / app_key
+    app_root.mkdir(parents=True)
+    artifacts = {a["type"]: a for a in manifest.get("artifacts", []) if a.get("app") == app_key and a["type"] in ["db", "files"]}
+    result: Dict[str, Any] = {
+        "app": app_key,
+        "run_id": run_id,
+        "target": target,
+        "started_at": now_iso(),
+        "phases": {},
+        "bytes": sum(int(a.get("size", 0)) for a in artifacts.values()),
+        "rto_objective_seconds": float(app_drill.get("rto_objective_seconds", drill_cfg.get("rto_objective_seconds", RESTORE_RTO_OBJECTIVE_SECONDS))),
+        "sanity": {},
+    }
+    phase_start = time.monotonic()
+    started = phase_start
+
+    def phase_done(name: str) -> None:
+        nonlocal phase_start
+        now = time.monotonic()
+        result["phases"][name] = round(now - phase_start, 3)
+        phase_start = now
+
+    database = None
+    try:
+        if not artifacts:
+            raise RuntimeError(f"run {run_id} has no db or files artifacts for {app_key}")
+        fetched = {kind: fetch_drill_artifact(a, run_id, app_root / "fetch", log_path) for kind, a in artifacts.items()}
+        phase_done("fetch")
+
+        sql_file = app_root / f"{app_key}.sql"
+        if "db" in fetched:
+            shell(["bash", "-lc", f"gunzip -c '{fetched['db']}' > '{sql_file}'"], log_path=log_path)
+        if "files" in fetched:
+            files_root = app_root / "files"
+            files_root.mkdir()
+            shell(["tar", "--zstd", "-xf", str(fetched["files"]), "-C", str(files_root)], log_path=log_path)
+            result["sanity"]["files_restored"] = sum(len(f) for _, _, f in os.walk(files_root))
+        phase_done("decompress")
+
+        if "db" in fetched:
+            database = DrillDatabase(f"ops-drill-{job_id}-{app_key}", app_root, app_key, cfg, target, drill_cfg, log_path)
+            database.start()
+            if target == "docker":
+                result["pg_image"] = database.pg_image
+            result["sanity"]["roles_created"] = database.create_roles(sql_file)
+            phase_done("provision")
+            database.load(sql_file)
+            phase_done("load")
+            tables = int(database.query("SELECT count(*) FROM information_schema.tables WHERE table_schema='public';") or "0")
+            result["sanity"]["public_tables"] = tables
+            if tables == 0:
+                raise RuntimeError(f"restored database for {app_key} has no public tables")
+            for sql in app_drill.get("sanity_queries") or []:
+                result["sanity"][sql] = database.query(sql)[:200]
+        elif result["sanity"].get("files_restored", 0) == 0:
+            raise RuntimeError(f"no files restored for {app_key}")
+        phase_done("sanity")
+        result["ok"] = True
+    except Exception as exc:  # noqa: BLE001
+        result["ok"] = False
+        result["error"] = str(exc)[-1000:]
+    finally:
+        if database:
+            database.stop()
+        result["rto_seconds"] = round(time.monotonic() - started, 3)
+    return result
+
+
+def record_restore_drill(job_id: str, result: Dict[str, Any]) -> None:
+    phases = result["phases"]
+    con = sqlite3.connect(DB_META)
+    con.execute(
+        """
+        INSERT OR REPLACE INTO restore_drills(job_id, app, run_id, target, started_at, ok, fetch_seconds, decompress_seconds,
+          provision_seconds, load_seconds, sanity_seconds, rto_seconds, rto_objective_seconds, bytes, error, details_json)
+        VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            job_id,
+            result["app"],
+            result["run_id"],
+            result["target"],
+            result["started_at"],
+            int(result["ok"]),
+            phases.get("fetch"),
+            phases.get("decompress"),
+            phases.get("provision"),
+            phases.get("load"),
+            phases.get("sanity"),
+            result["rto_seconds"],
+            result["rto_objective_seconds"],
+            result["bytes"],
+            result.get("error"),
+            json.dumps(result),
+        ),
+    )
+    con.commit()
+    con.close()
+
+
+def list_restore_drills(app: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+    sql = "SELECT * FROM restore_drills"
+    params: List[Any] = []
+    if app:
+        sql += " WHERE app = ?"
+        params.append(app)
+    sql += " ORDER BY started_at DESC LIMIT ?"
+    rows = db_query(sql, params + [limit])
+    for row in rows:
+        row["details"] = json.loads(row.pop("details_json"))
+        row["ok"] = bool(row["ok"])
+    return rows
+
+
+def refresh_drill_metrics() -> None:
+    rows = db_query(
+        """
+        SELECT d.* FROM restore_drills d
+        JOIN (SELECT app, max(started_at) AS started_at FROM restore_drills GROUP BY app) latest
+          ON latest.app = d.app AND latest.started_at = d.started_at
+        """,
+        [],
+    )
+    for row in rows:
+        app_key = row["app"]
+        metric_drill_success.labels(app=app_key).set(row["ok"])
+        metric_drill_epoch.labels(app=app_key).set(datetime.fromisoformat(row["started_at"]).timestamp())
+        metric_drill_objective.labels(app=app_key).set(row["rto_objective_seconds"])
+        if row["ok"]:
+            metric_drill_rto.labels(app=app_key).set(row["rto_seconds"])
+            for phase in RESTORE_DRILL_PHASES:
+                if row[f"{phase}_seconds"] is not None:
+                    metric_drill_phase.labels(app=app_key, phase=phase).set(row[f"{phase}_seconds"])
+
+
+def restore_drill_job(job_id: str, payload: Dict[str, Any], log_path: Path) -> Dict[str, Any]:
+    drill_cfg = load_config_section("restore_drill")
+    target = payload.get("target") or drill_cfg.get("target", "docker")
+    if target not in RESTORE_DRILL_TARGETS:
+        raise RuntimeError("unsupported target")
+    run_id = payload.get("run_id") or catalog_latest_run_id()
+    if not run_id:
+        raise RuntimeError("no runs available")
+    manifest_path = RUNS_META / run_id / "manifest.json"
+    if not manifest_path.exists():
+        raise RuntimeError("run manifest not found")
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    apps = resolve_apps(payload.get("apps") or manifest.get("apps"))
+    parallelism = int(payload.get("parallelism") or drill_cfg.get("parallelism", RESTORE_DRILL_PARALLELISM))
+
+    root = Path(tempfile.mkdtemp(prefix=f"drill-{job_id}-", dir="/tmp"))
+    # mkdtemp is 0700; the local target's run_as user must traverse into <root>/<app>
+    root.chmod(0o711)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, parallelism), thread_name_prefix="drill") as pool:
+            futures = [pool.submit(drill_app, job_id, run_id, manifest, app_key, cfg, drill_cfg, root, target, log_path) for app_key, cfg in apps.items()]
+            results = [f.result() for f in futures]
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    for result in results:
+        record_restore_drill(job_id, result)
+    refresh_drill_metrics()
+    failed = [r["app"] for r in results if not r["ok"]]
+    if failed:
+        raise RuntimeError(f"restore drill failed for {','.join(failed)}")
+    return {"run_id": run_id, "target": target, "parallelism": parallelism, "results": results}
+
+
 def list_rclone_remotes() -> List[str]:
     if not RCLONE_CONF.exists():
         return []
@@ -534,10 +1662,9 @@ def upload_job(job_id: str, payload: Dict[str, Any], log_path: Path) -> Dict[str
         raise RuntimeError("remote not configured")
 
     if payload.get("latest", False):
-        manifests = sorted([p.parent.name for p in RUNS_META.glob("*/manifest.json")])
-        if not manifests:
+        run_id = catalog_latest_run_id()
+        if not run_id:
             raise RuntimeError("no runs available")
-        run_id = manifests[-1]
 
     if not run_id:
         raise RuntimeError("run_id required")
@@ -615,13 +1742,223 @@ def system_status() -> Dict[str, Any]:
     }
 
 
+def load_fleet() -> Dict[str, Any]:
+    if not FLEET_FILE.exists():
+        return {}
+    data = yaml.safe_load(FLEET_FILE.read_text(encoding="utf-8")) or {}
+    peers = []
+    for raw in data.get("peers") or []:
+        if not raw.get("name") or not raw.get("url"):
+            raise RuntimeError("fleet peers need name and url")
+        token_file = Path(raw.get("token_file") or TOKEN_FILE)
+        peers.append({
+            "name": raw["name"],
+            "url": raw["url"].rstrip("/"),
+            "token": raw.get("token") or (read_text(token_file) if token_file.exists() else ""),
+            "timeout_seconds": float(raw.get("timeout_seconds", data.get("timeout_seconds", FLEET_TIMEOUT_SECONDS))),
+        })
+    return {"peers": peers, "cache_ttl_seconds": float(data.get("cache_ttl_seconds", FLEET_CACHE_TTL_SECONDS))}
+
+
+def fleet_client(peer: Dict[str, Any]) -> httpx.Client:
+    # one keep-alive pool per peer, rebuilt only when its url/token/timeout changes
+    key = (peer["name"], peer["url"], peer["token"], peer["timeout_seconds"])
+    with FLEET_LOCK:
+        client = FLEET_CLIENTS.get(key)
+        if client is None:
+            for stale in [k for k in FLEET_CLIENTS if k[0] == peer["name"]]:
+                FLEET_CLIENTS.pop(stale).close()
+            client = httpx.Client(
+                base_url=peer["url"],
+                headers={"X-OPS-TOKEN": peer["token"]},
+                timeout=httpx.Timeout(peer["timeout_seconds"]),
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+            )
+            FLEET_CLIENTS[key] = client
+    return client
+
+
+def peer_failure(peer: Dict[str, Any], path: str, entry: Dict[str, Any], cached: bool = False) -> Dict[str, Any]:
+    with FLEET_LOCK:
+        good = FLEET_CACHE.get((peer["name"], path))
+    if good:
+        # peer unreachable: serve the last good answer, flagged as stale
+        return {**good, "cached": True, "stale": True, "error": entry["error"]}
+    return {**entry, "cached": cached}
+
+
+def fetch_peer(peer: Dict[str, Any], path: str) -> Dict[str, Any]:
+    cache_key = (peer["name"], path)
+    started = time.monotonic()
+    # httpx timeouts apply per connect/read; this bounds the whole exchange
+    deadline = started + peer["timeout_seconds"]
+    entry: Dict[str, Any] = {"peer": peer["name"], "url": peer["url"], "fetched_at": now_iso(), "fetched_epoch": time.time()}
+    try:
+        with fleet_client(peer).stream("GET", path) as resp:
+            body = bytearray()
+            for chunk in resp.iter_bytes():
+                body += chunk
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"no complete response within {peer['timeout_seconds']}s")
+        text = body.decode(resp.encoding or "utf-8", errors="replace")
+        entry["status_code"] = resp.status_code
+        entry["ok"] = resp.status_code == 200
+        if not entry["ok"]:
+            entry["error"] = text[-500:]
+        elif path == "/metrics":
+            entry["data"] = text
+        else:
+            entry["data"] = json.loads(text)
+    except (httpx.HTTPError, ValueError, TimeoutError) as exc:
+        entry["ok"] = False
+        entry["error"] = f"{type(exc).__name__}: {exc}"
+    entry["elapsed_ms"] = round((time.monotonic() - started) * 1000, 1)
+
+    with FLEET_LOCK:
+        if entry["ok"]:
+            FLEET_CACHE[cache_key] = entry
+            FLEET_FAILURES.pop(cache_key, None)
+        else:
+            FLEET_FAILURES[cache_key] = entry
+    return entry
+
+
+def refresh_peer(peer: Dict[str, Any], path: str) -> None:
+    try:
+        fetch_peer(peer, path)
+    finally:
+        with FLEET_LOCK:
+            FLEET_REFRESHING.discard((peer["name"], path))
+
+
+def peer_answer(peer: Dict[str, Any], path: str, entry: Dict[str, Any], cached: bool) -> Dict[str, Any]:
+    if entry["ok"]:
+        return {**entry, "cached": cached}
+    return peer_failure(peer, path, entry, cached)
+
+
+def cached_peer(peer: Dict[str, Any], path: str, ttl: float) -> Dict[str, Any]:
+    cache_key = (peer["name"], path)
+    with FLEET_LOCK:
+        known = [e for e in [FLEET_CACHE.get(cache_key), FLEET_FAILURES.get(cache_key)] if e]
+        latest = max(known, key=lambda e: e["fetched_epoch"]) if known else None
+        refresh = latest is not None and time.time() - latest["fetched_epoch"] >= ttl and cache_key not in FLEET_REFRESHING
+        if refresh:
+            FLEET_REFRESHING.add(cache_key)
+    if latest is None:
+        return peer_answer(peer, path, fetch_peer(peer, path), False)
+    # answers (failures included) are reused for the ttl, then served stale while one refresh runs
+    if refresh:
+        FLEET_POOL.submit(refresh_peer, peer, path)
+    return peer_answer(peer, path, latest, True)
+
+
+def fleet_fetch(path: str) -> List[Dict[str, Any]]:
+    fleet = load_fleet()
+    if not fleet.get("peers"):
+        raise HTTPException(status_code=404, detail="fleet mode not configured")
+    started = time.monotonic()
+    futures = [(peer, FLEET_POOL.submit(cached_peer, peer, path, fleet["cache_ttl_seconds"])) for peer in fleet["peers"]]
+    results = []
+    for peer, future in futures:
+        # small grace over the peer timeout for pool scheduling
+        remaining = started + peer["timeout_seconds"] + 1.0 - time.monotonic()
+        try:
+            results.append(future.result(timeout=max(remaining, 0)))
+        except FutureTimeout:
+            entry = {
+                "peer": peer["name"],
+                "url": peer["url"],
+                "fetched_at": now_iso(),
+                "fetched_epoch": time.time(),
+                "ok": False,
+                "timed_out": True,
+                "error": f"timed out after {peer['timeout_seconds']}s",
+                "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
+            }
+            results.append(peer_failure(peer, path, entry))
+    return results
+
+
+def fleet_view(path: str, merge) -> Dict[str, Any]:
+    results = fleet_fetch(path)
+    peers = [{k: v for k, v in r.items() if k not in ["data", "fetched_epoch"]} for r in results]
+    merged = merge([r for r in results if "data" in r])
+    return {
+        "checked_at": now_iso(),
+        "peers_total": len(results),
+        "peers_ok": sum(1 for r in results if r["ok"]),
+        "peers": peers,
+        **merged,
+    }
+
+
+def merge_system(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"systems": [{"peer": r["peer"], **r["data"]} for r in results]}
+
+
+def merge_apps(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"apps": [{"peer": r["peer"], **app} for r in results for app in r["data"].get("apps", [])]}
+
+
+def merge_runs(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    runs_merged = [{"peer": r["peer"], **run} for r in results for run in r["data"].get("runs", [])]
+    runs_merged.sort(key=lambda x: x.get("timestamp") or "", reverse=True)
+    snapshots = [{"peer": r["peer"], **snap} for r in results for snap in r["data"].get("snapshots", [])]
+    return {"runs": runs_merged, "snapshots": snapshots}
+
+
+def add_peer_label(sample_line: str, peer: str) -> str:
+    label = 'peer="' + peer.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    brace = sample_line.find("{")
+    space = sample_line.find(" ")
+    if brace != -1 and (space == -1 or brace < space):
+        inner = sample_line[brace + 1 :]
+        sep = "" if inner.startswith("}") else ","
+        return sample_line[: brace + 1] + label + sep + inner
+    return sample_line[:space] + "{" + label + "}" + sample_line[space:]
+
+
+def merge_metrics(results: List[Dict[str, Any]]) -> str:
+    # regroup samples by metric family so each HELP/TYPE header appears once
+    families: Dict[str, Dict[str, Any]] = {}
+    for r in results:
+        current = None
+        for line in r["data"].splitlines():
+            if not line.strip():
+                continue
+            if line.startswith("# HELP ") or line.startswith("# TYPE "):
+                name = line.split(" ", 3)[2]
+                current = families.setdefault(name, {"help": None, "type": None, "samples": []})
+                field = "help" if line.startswith("# HELP ") else "type"
+                current[field] = current[field] or line
+                continue
+            if line.startswith("#") or current is None:
+                continue
+            current["samples"].append(add_peer_label(line, r["peer"]))
+    lines = []
+    for family in families.values():
+        lines += [x for x in [family["help"], family["type"]] if x] + family["samples"]
+    return "\n".join(lines) + "\n"
+
+
 class BackupRequest(BaseModel):
     apps: Optional[List[str]] = None
     scopes: List[str] = Field(default_factory=lambda: ["db", "files", "env", "caddy"])
+    skip_unchanged: bool = False
 
 
 class ValidateRequest(BaseModel):
     run_id: Optional[str] = None
+    time_budget_seconds: Optional[float] = None
+    byte_budget: Optional[int] = None
+
+
+class PruneRequest(BaseModel):
+    mode: str = "routine"
+    dry_run: bool = False
+    max_unused: Optional[str] = None
+    max_repack_size: Optional[str] = None
 
 
 class RestoreRequest(BaseModel):
@@ -632,6 +1969,13 @@ class RestoreRequest(BaseModel):
     allow_same_server: bool = False
 
 
+class RestoreDrillRequest(BaseModel):
+    run_id: Optional[str] = None
+    apps: Optional[List[str]] = None
+    target: Optional[str] = None
+    parallelism: Optional[int] = None
+
+
 class UploadRequest(BaseModel):
     remote: str
     remote_path: str = "ops-backups"
@@ -643,6 +1987,9 @@ class UploadRequest(BaseModel):
 def startup() -> None:
     init_db()
     ensure_restic_init()
+    refresh_verify_metrics()
+    catalog_backfill()
+    refresh_drill_metrics()
 
 
 @APP.get("/health")
@@ -666,13 +2013,8 @@ def status_system() -> Dict[str, Any]:
 
 
 @APP.get("/runs", dependencies=[Depends(token_guard)])
-def runs() -> Dict[str, Any]:
-    manifests = []
-    for mp in sorted(RUNS_META.glob("*/manifest.json"), reverse=True):
-        try:
-            manifests.append(json.loads(mp.read_text(encoding="utf-8")))
-        except Exception:
-            continue
+def runs(limit: int = 200) -> Dict[str, Any]:
+    manifests = [json.loads(r["manifest_json"]) for r in catalog_runs(limit=limit, with_manifest=True)]
     snapshots = json.loads(
         shell(["restic", "-r", str(BACKUP_REPO), "snapshots", "--json"], env={"RESTIC_PASSWORD_FILE": str(RESTIC_PASSWORD_FILE)}, check=False).stdout
         or "[]"
@@ -712,6 +2054,88 @@ def run_log(run_id: str) -> PlainTextResponse:
     return PlainTextResponse(p.read_text(encoding="utf-8"))
 
 
+@APP.get("/prune/plan", dependencies=[Depends(token_guard)])
+def prune_plan(refresh: bool = False) -> Dict[str, Any]:
+    return load_prune_plan(refresh)
+
+
+@APP.get("/verify/coverage", dependencies=[Depends(token_guard)])
+def verify_coverage_status() -> Dict[str, Any]:
+    return verify_coverage(int(load_config_section("verify").get("subsets", VERIFY_SUBSETS)))
+
+
+@APP.get("/fleet/peers", dependencies=[Depends(token_guard)])
+def fleet_peers() -> Dict[str, Any]:
+    return fleet_view("/health", lambda results: {})
+
+
+@APP.get("/fleet/status/system", dependencies=[Depends(token_guard)])
+def fleet_status_system() -> Dict[str, Any]:
+    return fleet_view("/status/system", merge_system)
+
+
+@APP.get("/fleet/status/apps", dependencies=[Depends(token_guard)])
+def fleet_status_apps() -> Dict[str, Any]:
+    return fleet_view("/status/apps", merge_apps)
+
+
+@APP.get("/fleet/runs", dependencies=[Depends(token_guard)])
+def fleet_runs() -> Dict[str, Any]:
+    return fleet_view("/runs", merge_runs)
+
+
+@APP.get("/fleet/metrics")
+def fleet_metrics() -> PlainTextResponse:
+    results = fleet_fetch("/metrics")
+    body = merge_metrics([r for r in results if "data" in r])
+    body += "# HELP ops_fleet_peer_up peer agent answered the last fan-out\n# TYPE ops_fleet_peer_up gauge\n"
+    for r in results:
+        body += add_peer_label(f"ops_fleet_peer_up {1.0 if r['ok'] else 0.0}", r["peer"]) + "\n"
+    return PlainTextResponse(body, media_type=CONTENT_TYPE_LATEST)
+
+
+@APP.get("/catalog/runs", dependencies=[Depends(token_guard)])
+def catalog_runs_endpoint(
+    app: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    limit: int = 100,
+) -> Dict[str, Any]:
+    rows = catalog_runs(app=app, since=since, until=until, limit=limit)
+    for row in rows:
+        row["scopes"] = json.loads(row.pop("scopes_json"))
+        row["ok"] = bool(row["ok"])
+    return {"runs": rows}
+
+
+@APP.get("/catalog/artifacts", dependencies=[Depends(token_guard)])
+def catalog_artifacts_endpoint(
+    app: Optional[str] = None,
+    type: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    min_size: Optional[int] = None,
+    max_size: Optional[int] = None,
+    ok_only: bool = False,
+    limit: int = 500,
+) -> Dict[str, Any]:
+    rows = catalog_artifacts(app, type, since, until, min_size, max_size, ok_only, limit)
+    return {"artifacts": rows, "count": len(rows), "total_size": sum(r["size"] for r in rows)}
+
+
+@APP.get("/catalog/latest", dependencies=[Depends(token_guard)])
+def catalog_latest(app: Optional[str] = None, type: Optional[str] = None) -> Dict[str, Any]:
+    rows = catalog_artifacts(app, type, ok_only=True, limit=1)
+    if not rows:
+        raise HTTPException(status_code=404, detail="no matching artifact")
+    return rows[0]
+
+
+@APP.get("/restore_drills", dependencies=[Depends(token_guard)])
+def restore_drills(app: Optional[str] = None, limit: int = 50) -> Dict[str, Any]:
+    return {"drills": list_restore_drills(app, limit)}
+
+
 @APP.get("/cloud/remotes", dependencies=[Depends(token_guard)])
 def cloud_remotes() -> Dict[str, Any]:
     return {"remotes": list_rclone_remotes()}
@@ -750,8 +2174,10 @@ def action_validate(req: ValidateRequest, actor: str = Depends(token_guard)) ->
 
 
 @APP.post("/actions/prune", dependencies=[Depends(token_guard)])
-def action_prune(actor: str = Depends(token_guard)) -> Dict[str, Any]:
-    return start_job("prune", {}, actor, prune_job)
+def action_prune(req: PruneRequest, actor: str = Depends(token_guard)) -> Dict[str, Any]:
+    if req.mode not in PRUNE_MODES:
+        raise HTTPException(status_code=400, detail=f"mode must be one of {','.join(PRUNE_MODES)}")
+    return start_job("prune", req.model_dump(), actor, prune_job)
 
 
 @APP.post("/actions/restore", dependencies=[Depends(token_guard)])
@@ -767,6 +2193,13 @@ def action_export(req: Dict[str, str], actor: str = Depends(token_guard)) -> Dic
     return start_job("export_bundle", {"run_id": run_id}, actor, export_bundle_job)
 
 
+@APP.post("/actions/restore_drill", dependencies=[Depends(token_guard)])
+def action_restore_drill(req: RestoreDrillRequest, actor: str = Depends(token_guard)) -> Dict[str, Any]:
+    if req.target and req.target not in RESTORE_DRILL_TARGETS:
+        raise HTTPException(status_code=400, detail=f"target must be one of {','.join(RESTORE_DRILL_TARGETS)}")
+    return start_job("restore_drill", req.model_dump(), actor, restore_drill_job)
+
+
 @APP.post("/actions/upload/latest", dependencies=[Depends(token_guard)])
 def action_upload_latest(req: UploadRequest, actor: str = Depends(token_guard)) -> Dict[str, Any]:
     payload = req.model_dump()
@@ -23,10 +23,11 @@ case "${1:-}" in
     ;;
   backup)
     apps="${2:-}"
-    if [[ -n "$apps" ]]; then
-      json_post "/actions/backup" "{\"apps\":[$(echo "$apps" | awk -F, '{for(i=1;i<=NF;i++)printf "\""$i"\"%s",(i<NF?",":"") }')],\"scopes\":[\"db\",\"files\",\"env\",\"caddy\"]}"
+    skip_unchanged="${3:-false}"
+    if [[ -n "$apps" && "$apps" != "all" ]]; then
+      json_post "/actions/backup" "{\"apps\":[$(echo "$apps" | awk -F, '{for(i=1;i<=NF;i++)printf "\""$i"\"%s",(i<NF?",":"") }')],\"scopes\":[\"db\",\"files\",\"env\",\"caddy\"],\"skip_unchanged\":$skip_unchanged}"
     else
-      json_post "/actions/backup" '{"scopes":["db","files","env","caddy"]}'
+      json_post "/actions/backup" "{\"scopes\":[\"db\",\"files\",\"env\",\"caddy\"],\"skip_unchanged\":$skip_unchanged}"
     fi
     ;;
   validate)
@@ -38,7 +39,13 @@ case "${1:-}" in
     fi
     ;;
   prune)
-    json_post "/actions/prune" '{}'
+    mode="${2:-routine}"
+    dry_run="${3:-false}"
+    json_post "/actions/prune" "{\"mode\":\"$mode\",\"dry_run\":$dry_run}"
+    ;;
+  prune-plan)
+    refresh="${2:-false}"
+    curl -sS -H "X-OPS-TOKEN: $TOKEN" "$OPS_URL/prune/plan?refresh=$refresh"
     ;;
   restore)
     run_id="${2:-}"
@@ -48,6 +55,17 @@ case "${1:-}" in
     [[ -n "$run_id" ]] || { echo "usage: $0 restore <run_id> <mode> [typed] [allow_same_server]"; exit 1; }
     json_post "/actions/restore" "{\"run_id\":\"$run_id\",\"mode\":\"$mode\",\"typed_confirmation\":\"$typed\",\"allow_same_server\":$allow}"
     ;;
+  drill)
+    run_id="${2:-}"
+    apps="${3:-}"
+    body="{"
+    [[ -n "$run_id" && "$run_id" != "latest" ]] && body+="\"run_id\":\"$run_id\","
+    [[ -n "$apps" ]] && body+="\"apps\":[$(echo "$apps" | awk -F, '{for(i=1;i<=NF;i++)printf "\""$i"\"%s",(i<NF?",":"") }')],"
+    json_post "/actions/restore_drill" "${body%,}}"
+    ;;
+  drills)
+    curl -sS -H "X-OPS-TOKEN: $TOKEN" "$OPS_URL/restore_drills?${2:+app=$2}"
+    ;;
   export)
     run_id="${2:-}"
     [[ -n "$run_id" ]] || { echo "usage: $0 export <run_id>"; exit 1; }
@@ -74,13 +92,28 @@ case "${1:-}" in
     [[ -n "$remote" ]] || { echo "usage: $0 test-remote <remote>"; exit 1; }
     json_post "/cloud/test" "{\"remote\":\"$remote\"}"
     ;;
+  catalog)
+    view="${2:-artifacts}"
+    query="${3:-}"
+    [[ "$view" =~ ^(runs|artifacts|latest)$ ]] || { echo "usage: $0 catalog {runs|artifacts|latest} ['app=lims&type=db&since=2026-01-01']"; exit 1; }
+    curl -sS -H "X-OPS-TOKEN: $TOKEN" "$OPS_URL/catalog/$view?$query"
+    ;;
+  fleet)
+    view="${2:-peers}"
+    case "$view" in
+      peers|runs) curl -sS -H "X-OPS-TOKEN: $TOKEN" "$OPS_URL/fleet/$view" ;;
+      system|apps) curl -sS -H "X-OPS-TOKEN: $TOKEN" "$OPS_URL/fleet/status/$view" ;;
+      metrics) curl -sS "$OPS_URL/fleet/metrics" ;;
+      *) echo "usage: $0 fleet {peers|system|apps|runs|metrics}"; exit 1 ;;
+    esac
+    ;;
   job)
     job_id="${2:-}"
     [[ -n "$job_id" ]] || { echo "usage: $0 job <job_id>"; exit 1; }
     curl -sS -H "X-OPS-TOKEN: $TOKEN" "$OPS_URL/jobs/$job_id"
     ;;
   *)
-    echo "usage: $0 {health|runs|backup|validate|prune|restore|export|upload-latest|upload-run|remotes|test-remote|job}"
+    echo "usage: $0 {health|runs|backup|validate|prune|prune-plan|restore|drill|drills|export|upload-latest|upload-run|remotes|test-remote|catalog|fleet|job}"
     exit 1
     ;;
 esac